@@ -10,6 +10,13 @@ from src.commands.worktree import uncommitted_changes
 
 console = Console()
 
+_STATUS_COLORS = {
+    "M": "yellow",
+    "A": "green",
+    "D": "red",
+    "??": "cyan",
+}
+
 
 def prompt_uncommitted_changes(
     worktree: Path,
@@ -41,17 +48,16 @@ def prompt_uncommitted_changes(
 
 def print_change_summary(changes: str) -> None:
     """Pretty-print a short summary of porcelain status output."""
-    lines = changes.splitlines()
-    for line in lines[:15]:
-        status, _, name = line.partition(" ")
-        name = name.strip()
-        color = {
-            "M": "yellow",
-            "A": "green",
-            "D": "red",
-            "??": "cyan",
-        }.get(status.strip(), "white")
-        console.print(f"  [{color}]{status}[/{color}] {name}")
-    if len(lines) > 15:
-        console.print(f"  [dim]... and {len(lines) - 15} more[/dim]")
+    # Only the shown lines are split out; the rest is just counted.
+    lines = changes.split("\n", 15)[:15]
+    rendered: list[str] = []
+    for line in lines:
+        # Porcelain v1 is a fixed two-column XY status, a space, then the path
+        status, name = line[:2], line[3:]
+        color = _STATUS_COLORS.get(status.strip(), "white")
+        rendered.append(f"  [{color}]{status}[/{color}] {name}")
+    hidden = changes.count("\n") + 1 - len(lines)
+    if hidden > 0:
+        rendered.append(f"  [dim]... and {hidden} more[/dim]")
+    console.print("\n".join(rendered))
     console.print()
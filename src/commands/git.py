@@ -1,3 +1,6 @@
+import functools
+import os
+import re
 import subprocess
 from pathlib import Path
 
@@ -9,6 +12,22 @@ from src.settings import SKIP_NAMES, SKIP_PREFIXES, SKIP_SUFFIXES
 
 console = Console()
 
+# All should_sync skip rules folded into one pattern so each path is checked in a
+# single regex scan: prefixes match anywhere, names match the basename exactly,
+# and suffixes match the end of the path. \Z rather than $, which would also
+# match before a trailing newline, a legal filename character.
+_SKIP_RE = re.compile(
+    "|".join(
+        [
+            *(re.escape(prefix) for prefix in SKIP_PREFIXES),
+            *(rf"(?:^|/){re.escape(name)}\Z" for name in SKIP_NAMES),
+            *(rf"{re.escape(suffix)}\Z" for suffix in SKIP_SUFFIXES),
+        ]
+    )
+)
+# Same rules for raw paths streamed from git, which are never decoded.
+_SKIP_BYTES_RE = re.compile(os.fsencode(_SKIP_RE.pattern))
+
 
 def detect_repo() -> Path | None:
     """Detect the root of the main git repository from the current directory.
@@ -16,10 +35,16 @@ def detect_repo() -> Path | None:
     Works even when CWD is inside an existing worktree.
     Returns None if not inside a git repository.
     """
+    return _detect_repo(os.getcwd())
+
+
+@functools.cache
+def _detect_repo(cwd: str) -> Path | None:
     result = subprocess.run(
         ["git", "rev-parse", "--path-format=absolute", "--git-common-dir"],
         capture_output=True,
         text=True,
+        cwd=cwd,
     )
     if result.returncode != 0:
         return None
@@ -28,8 +53,12 @@ def detect_repo() -> Path | None:
     return git_common_dir.parent
 
 
+@functools.cache
 def get_current_branch(repo: Path) -> str:
-    """Return the current branch name for the given repo."""
+    """Return the current branch name for the given repo.
+
+    Cached per process: nothing claudway runs changes the main checkout's HEAD.
+    """
     result = subprocess.run(
         ["git", "-C", str(repo), "rev-parse", "--abbrev-ref", "HEAD"],
         capture_output=True,
@@ -40,15 +69,11 @@ def get_current_branch(repo: Path) -> str:
     return result.stdout.strip()
 
 
-def should_sync(path: str) -> bool:
+def should_sync(path: str | bytes) -> bool:
     """Return True if this untracked file should be synced to the worktree."""
-    for prefix in SKIP_PREFIXES:
-        if prefix in path:
-            return False
-    name = path.rsplit("/", 1)[-1]
-    if name in SKIP_NAMES:
-        return False
-    return not name.endswith(SKIP_SUFFIXES)
+    if isinstance(path, bytes):
+        return _SKIP_BYTES_RE.search(path) is None
+    return _SKIP_RE.search(path) is None
 
 
 def git(repo: Path, *args: str) -> subprocess.CompletedProcess[str]:
@@ -70,7 +95,8 @@ def git(repo: Path, *args: str) -> subprocess.CompletedProcess[str]:
 def branch_exists(repo: Path, branch: str) -> bool:
     result = subprocess.run(
         ["git", "-C", str(repo), "rev-parse", "--verify", branch],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
     return result.returncode == 0
 
@@ -82,10 +108,14 @@ def ensure_branch(repo: Path, branch: str, base: str | None = None) -> str:
         branch = branch.removeprefix("origin/")
     if branch_exists(repo, branch):
         return branch
-    # If a remote tracking branch exists, create a local branch tracking it
-    remote_ref = f"origin/{branch}"
-    if branch_exists(repo, remote_ref):
-        git(repo, "branch", "--track", branch, remote_ref)
+    # If a remote tracking branch exists, create a local branch tracking it.
+    # Attempting the --track directly saves a separate probe for the remote ref;
+    # git refuses when origin/<branch> doesn't exist.
+    try:
+        git(repo, "branch", "--track", branch, f"origin/{branch}")
+    except subprocess.CalledProcessError:
+        pass
+    else:
         return branch
     create = typer.confirm(
         f"Branch '{branch}' does not exist. Create it?", default=True
@@ -99,44 +129,33 @@ def ensure_branch(repo: Path, branch: str, base: str | None = None) -> str:
     return branch
 
 
-def list_local_branches(repo: Path) -> list[str]:
-    """Return local branch names sorted by most recent commit first."""
-    try:
-        output = git(
-            repo,
-            "branch",
-            "--sort=-committerdate",
-            "--format=%(refname:short)",
-        )
-    except subprocess.CalledProcessError:
-        return []
-    return [b for b in output.stdout.strip().splitlines() if b]
-
+def list_branches(repo: Path) -> tuple[list[str], list[str]]:
+    """Return (local, origin) branch names, each sorted by recency.
 
-def list_remote_branches(repo: Path) -> list[str]:
-    """Return remote branch names (no prefix), sorted by recency."""
+    Reads both namespaces with a single for-each-ref rather than one
+    ``git branch`` call per listing. Origin names have their prefix stripped.
+    """
     try:
         output = git(
             repo,
-            "branch",
-            "-r",
+            "for-each-ref",
             "--sort=-committerdate",
-            "--format=%(refname:short)",
+            "--format=%(refname)",
+            "refs/heads",
+            "refs/remotes/origin",
         )
     except subprocess.CalledProcessError:
-        return []
-    branches: list[str] = []
-    for b in output.stdout.strip().splitlines():
-        if not b or "/HEAD" in b:
-            continue
-        # Only include branches from origin; other remotes would fail
-        # to track/checkout with the hardcoded origin/ assumptions elsewhere.
-        if not b.startswith("origin/"):
-            continue
-        name = b.removeprefix("origin/")
-        if name:
-            branches.append(name)
-    return branches
+        return [], []
+    local: list[str] = []
+    remote: list[str] = []
+    for ref in output.stdout.splitlines():
+        if ref.startswith("refs/heads/"):
+            local.append(ref.removeprefix("refs/heads/"))
+        elif (
+            ref.startswith("refs/remotes/origin/") and ref != "refs/remotes/origin/HEAD"
+        ):
+            remote.append(ref.removeprefix("refs/remotes/origin/"))
+    return local, remote
 
 
 CREATE_NEW = "+ Create new branch..."
@@ -146,16 +165,15 @@ def select_branch(repo: Path) -> str:
     """Show a fuzzy-filterable branch list. Falls back to plain prompt if not a TTY."""
     from src.commands.picker import fuzzy_select, is_interactive
 
-    current = get_current_branch(repo)
-    local = [b for b in list_local_branches(repo) if b != current]
-    local_set = set(local)
-    remote_only = [
-        b for b in list_remote_branches(repo) if b not in local_set and b != current
-    ]
-
     if not is_interactive():
         return typer.prompt("Enter a branch name")
 
+    current = get_current_branch(repo)
+    all_local, all_remote = list_branches(repo)
+    local = [b for b in all_local if b != current]
+    local_set = set(local)
+    remote_only = [b for b in all_remote if b not in local_set and b != current]
+
     choices: list[str] = [CREATE_NEW]
     choices.extend(local)
     choices.extend(f"origin/{b}" for b in remote_only)
@@ -1,8 +1,13 @@
 """Shared fuzzy picker helpers using InquirerPy."""
 
+import functools
 import sys
 from collections.abc import Sequence
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from InquirerPy.utils import InquirerPyStyle
 
 
 PICKER_STYLE_DICT = {
@@ -26,22 +31,33 @@ def is_interactive() -> bool:
 def fuzzy_select(
     message: str,
     choices: Sequence[str | dict[str, Any]],
+    auto_select_single: bool = True,
 ) -> str:
     """Show a fuzzy-filterable picker and return the selected value.
 
     Each choice can be a plain string or a dict with "name" (display)
-    and "value" (returned on selection) keys.
+    and "value" (returned on selection) keys. A lone choice is returned
+    without starting the picker unless *auto_select_single* is False.
     """
-    from InquirerPy import inquirer  # pyright: ignore[reportPrivateImportUsage]
-    from InquirerPy.utils import (  # pyright: ignore[reportPrivateImportUsage]
-        get_style,
-    )
+    if auto_select_single and len(choices) == 1:
+        only = choices[0]
+        return only if isinstance(only, str) else only["value"]
 
-    style = get_style(PICKER_STYLE_DICT, style_override=False)
+    from InquirerPy import inquirer  # pyright: ignore[reportPrivateImportUsage]
 
     result: str = inquirer.fuzzy(  # pyright: ignore[reportPrivateImportUsage]
         message=message,
         choices=list(choices),
-        style=style,
+        style=_picker_style(),
     ).execute()
     return result
+
+
+@functools.cache
+def _picker_style() -> "InquirerPyStyle":
+    """Build the InquirerPy style once; the import stays lazy like fuzzy_select's."""
+    from InquirerPy.utils import (  # pyright: ignore[reportPrivateImportUsage]
+        get_style,
+    )
+
+    return get_style(PICKER_STYLE_DICT, style_override=False)
@@ -42,7 +42,7 @@ def rm(
         raise typer.Exit(1)
 
     removable = [
-        wt for wt in list_worktrees(repo) if wt["type"] in ("persistent", "temporary")
+        wt for wt in list_worktrees(repo) if wt.type in ("persistent", "temporary")
     ]
 
     if not removable:
@@ -50,35 +50,33 @@ def rm(
         raise typer.Exit(1)
 
     if name is not None:
-        match = [wt for wt in removable if wt.get("branch") == name]
+        match = [wt for wt in removable if wt.branch == name]
         if not match:
             console.print(f"[red]No worktree found for branch '{name}'.[/red]")
             console.print("[dim]Available worktrees:[/dim]")
             for wt in removable:
-                console.print(
-                    f"  {wt.get('branch', '(detached)')}  ({wt['type']})  {wt['path']}"
-                )
+                console.print(f"  {wt.branch}  ({wt.type})  {wt.path}")
             raise typer.Exit(1)
         selected = match[0]
     elif is_interactive():
         choices = [
-            {
-                "name": (
-                    f"{wt.get('branch', '(detached)')}  ({wt['type']})  {wt['path']}"
-                ),
-                "value": wt["path"],
-            }
+            {"name": f"{wt.branch}  ({wt.type})  {wt.path}", "value": wt.path}
             for wt in removable
         ]
-        picked = fuzzy_select("Select worktree to remove:", choices)
-        selected = next(wt for wt in removable if wt["path"] == picked)
+        # With --force there's no confirmation afterwards, so the picker is the
+        # only chance to see what is about to be removed.
+        picked = fuzzy_select(
+            "Select worktree to remove:", choices, auto_select_single=not force
+        )
+        by_path = {wt.path: wt for wt in removable}
+        selected = by_path[picked]
     else:
         console.print("[red]No TTY — pass a branch name.[/red]")
         raise typer.Exit(1)
 
-    wt_path = Path(selected["path"])
-    branch = selected.get("branch", "(detached)")
-    wt_type = selected["type"]
+    wt_path = Path(selected.path)
+    branch = selected.branch
+    wt_type = selected.type
 
     if not force and wt_path.exists():
         changes = uncommitted_changes(wt_path)
@@ -1,8 +1,14 @@
 import os
+import shlex
 import subprocess
 from pathlib import Path
 
 
+# Characters that need /bin/sh to interpret the agent command. Anything else is
+# plain words and can be exec'd directly without the extra shell process.
+_SHELL_METACHARS = frozenset("|&;<>()$`\\*?[]{}~#!%\n")
+
+
 def launch_shell(
     user_shell: str,
     shell_env: dict[str, str],
@@ -12,6 +18,35 @@ def launch_shell(
     subprocess.run([user_shell, "-i"], cwd=cwd, env=shell_env)
 
 
+def agent_argv(agent_cmd: str) -> list[str] | None:
+    """Split *agent_cmd* into argv, or return None if it needs a shell."""
+    if _SHELL_METACHARS.intersection(agent_cmd):
+        return None
+    try:
+        argv = shlex.split(agent_cmd)
+    except ValueError:
+        return None
+    # A leading VAR=value assignment is shell syntax too
+    if not argv or "=" in argv[0]:
+        return None
+    return argv
+
+
+def run_agent(agent_cmd: str, cwd: Path) -> None:
+    """Run the agent command in the worktree, skipping /bin/sh when possible."""
+    argv = agent_argv(agent_cmd)
+    if argv is not None:
+        try:
+            subprocess.run(argv, cwd=cwd)
+        except OSError:
+            # Not found, not executable, or a shell function/alias
+            pass
+        else:
+            return
+    # Let the shell interpret the command (and report it if it can't run it)
+    subprocess.run(agent_cmd, cwd=cwd, shell=True)
+
+
 def build_shell_env() -> dict[str, str]:
     """Build a shell environment with the claudway venv stripped out."""
     env = {k: v for k, v in os.environ.items() if k != "VIRTUAL_ENV"}
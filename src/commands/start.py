@@ -1,9 +1,10 @@
 import atexit
+import functools
 import os
 import signal
-import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Annotated, Any
 
@@ -13,7 +14,7 @@ from rich.console import Console
 from src.app import app
 from src.commands.cleanup import prompt_uncommitted_changes
 from src.commands.git import detect_repo, get_current_branch, resolve_branch
-from src.commands.shell import build_shell_env, launch_shell
+from src.commands.shell import build_shell_env, launch_shell, run_agent
 from src.commands.worktree import (
     WorktreeConflictError,
     cleanup_worktree,
@@ -23,6 +24,7 @@ from src.commands.worktree import (
     persistent_worktree_dir,
     sanitize_branch_name,
     sync_untracked_files,
+    trust_mise_config,
 )
 from src.settings import ClaudwaySettings
 
@@ -102,7 +104,7 @@ def _enter_existing_worktree(
 
     if not shell_only:
         console.print(f"[bold cyan]Launching:[/bold cyan] {agent_cmd}\n")
-        subprocess.run(agent_cmd, cwd=wt_path, shell=True)
+        run_agent(agent_cmd, wt_path)
 
     console.print("[dim]Dropping into shell. Type 'exit' to leave.[/dim]\n")
 
@@ -110,6 +112,33 @@ def _enter_existing_worktree(
     launch_shell(user_shell, shell_env, wt_path)
 
 
+def _prepare_worktree(repo: Path, worktree: Path, *, reused: bool = False) -> None:
+    """Sync untracked files, link deps and trust mise config in a new worktree.
+
+    The sync and the dep symlinks touch disjoint paths, so they run side by side
+    and each is reported as it finishes. mise trust waits for both, since the
+    mise.toml it reads may itself be an untracked file.
+    """
+    stages = {
+        # A reused persistent worktree may have another session running in it
+        "Untracked files synced": functools.partial(
+            sync_untracked_files, inplace=not reused
+        ),
+        "Dependencies linked": link_deps,
+    }
+    with (
+        console.status("[bold cyan]Preparing worktree ...", spinner="dots"),
+        ThreadPoolExecutor(max_workers=len(stages)) as pool,
+    ):
+        futures = {
+            pool.submit(stage, repo, worktree): done for done, stage in stages.items()
+        }
+        for future in as_completed(futures):
+            future.result()
+            console.print(f"[green]\u2713[/green] {futures[future]}")
+        trust_mise_config(worktree)
+
+
 def _go_persistent(
     repo: Path,
     branch: str,
@@ -142,16 +171,7 @@ def _go_persistent(
             f"[green]\u2713[/green] Worktree created for [bold]{branch}[/bold]"
         )
 
-    with console.status("[bold cyan]Syncing untracked files ...", spinner="dots"):
-        sync_untracked_files(repo, wt_dir)
-    console.print("[green]\u2713[/green] Untracked files synced")
-
-    with console.status("[bold cyan]Linking dependencies ...", spinner="dots"):
-        link_deps(repo, wt_dir)
-    console.print("[green]\u2713[/green] Dependencies linked")
-
-    if (wt_dir / "mise.toml").exists():
-        subprocess.run(["mise", "trust"], cwd=wt_dir, capture_output=True)
+    _prepare_worktree(repo, wt_dir, reused=reused)
 
     console.print()
     console.print(
@@ -162,7 +182,7 @@ def _go_persistent(
 
     if not shell_only:
         console.print(f"[bold cyan]Launching:[/bold cyan] {agent_cmd}\n")
-        subprocess.run(agent_cmd, cwd=wt_dir, shell=True)
+        run_agent(agent_cmd, wt_dir)
 
     console.print(
         "[dim]Dropping into shell. Type 'exit' to leave (worktree persists).[/dim]\n"
@@ -180,8 +200,10 @@ def _go_temporary(
     shell_only: bool,
 ) -> None:
     sanitized = sanitize_branch_name(branch)
+    # git worktree add accepts an existing empty dir, so the worktree goes
+    # straight into mkdtemp's: no window for the name to be taken, and the
+    # synced .env files stay private (0700) under a shared temp dir.
     tmpdir = Path(tempfile.mkdtemp(prefix=f"cw-{sanitized}-"))
-    tmpdir.rmdir()  # git worktree add requires the target dir not to exist
     cleanup_done = False
 
     # Shell context - populated once the worktree is ready, used by cleanup
@@ -217,6 +239,7 @@ def _go_temporary(
                 create_worktree(repo, tmpdir, branch)
         except WorktreeConflictError as conflict:
             atexit.unregister(do_cleanup)
+            tmpdir.rmdir()
             return _enter_existing_worktree(
                 Path(conflict.existing_path),
                 branch,
@@ -228,16 +251,7 @@ def _go_temporary(
             f"[green]\u2713[/green] Worktree created for [bold]{branch}[/bold]"
         )
 
-        with console.status("[bold cyan]Syncing untracked files ...", spinner="dots"):
-            sync_untracked_files(repo, tmpdir)
-        console.print("[green]\u2713[/green] Untracked files synced")
-
-        with console.status("[bold cyan]Linking dependencies ...", spinner="dots"):
-            link_deps(repo, tmpdir)
-        console.print("[green]\u2713[/green] Dependencies linked")
-
-        if (tmpdir / "mise.toml").exists():
-            subprocess.run(["mise", "trust"], cwd=tmpdir, capture_output=True)
+        _prepare_worktree(repo, tmpdir)
 
         console.print()
         console.print(f"[bold green]Worktree ready![/bold green] [dim]{tmpdir}[/dim]")
@@ -249,7 +263,7 @@ def _go_temporary(
 
         if not shell_only:
             console.print(f"[bold cyan]Launching:[/bold cyan] {agent_cmd}\n")
-            subprocess.run(agent_cmd, cwd=tmpdir, shell=True)
+            run_agent(agent_cmd, tmpdir)
 
         console.print("[dim]Dropping into shell. Type 'exit' to clean up.[/dim]\n")
 
@@ -1,5 +1,4 @@
 from rich.console import Console
-from rich.table import Table
 
 from src.app import app
 from src.commands.git import detect_repo
@@ -13,6 +12,8 @@ console = Console()
 @app.command()
 def status() -> None:
     """Show current configuration and active worktrees."""
+    from rich.table import Table
+
     settings = ClaudwaySettings.load()
 
     table = Table(title="Claudway Config", title_style="bold cyan")
@@ -46,12 +47,7 @@ def status() -> None:
         }
 
         for wt in worktrees:
-            wt_type = wt.get("type", "unknown")
-            style = type_styles.get(wt_type, "dim")
-            wt_table.add_row(
-                wt.get("branch", "(detached)"),
-                f"[{style}]{wt_type}[/{style}]",
-                wt.get("path", ""),
-            )
+            style = type_styles.get(wt.type, "dim")
+            wt_table.add_row(wt.branch, f"[{style}]{wt.type}[/{style}]", wt.path)
         console.print()
         console.print(wt_table)
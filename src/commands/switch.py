@@ -9,7 +9,7 @@ from src.app import app
 from src.commands.git import detect_repo
 from src.commands.picker import fuzzy_select, is_interactive
 from src.commands.shell import build_shell_env, launch_shell
-from src.commands.worktree import list_worktrees
+from src.commands.worktree import WorktreeRecord, list_worktrees
 
 
 console = Console()
@@ -17,12 +17,10 @@ console = Console()
 _SWITCHABLE_TYPES = ("main", "persistent", "temporary")
 
 
-def _format_choice(wt: dict[str, str]) -> dict[str, str]:
+def _format_choice(wt: WorktreeRecord) -> dict[str, str]:
     """Build a fuzzy picker choice with plain-text display."""
-    branch = wt.get("branch", "(detached)")
-    wt_type = wt["type"]
-    label = f"{branch}  ({wt_type})  {wt['path']}"
-    return {"name": label, "value": wt["path"]}
+    label = f"{wt.branch}  ({wt.type})  {wt.path}"
+    return {"name": label, "value": wt.path}
 
 
 @app.command()
@@ -38,7 +36,7 @@ def switch(
         console.print("[red]Not inside a git repository.[/red]")
         raise typer.Exit(1)
 
-    switchable = [wt for wt in list_worktrees(repo) if wt["type"] in _SWITCHABLE_TYPES]
+    switchable = [wt for wt in list_worktrees(repo) if wt.type in _SWITCHABLE_TYPES]
 
     if not switchable:
         console.print("[yellow]No worktrees found.[/yellow]")
@@ -46,30 +44,31 @@ def switch(
         raise typer.Exit(1)
 
     if name is not None:
-        match = [wt for wt in switchable if wt.get("branch") == name]
+        match = [wt for wt in switchable if wt.branch == name]
         if not match:
             console.print(f"[red]No worktree found for branch '{name}'.[/red]")
             console.print("[dim]Available worktrees:[/dim]")
             for wt in switchable:
-                console.print(f"  {wt.get('branch', '(detached)')}  ({wt['type']})")
+                console.print(f"  {wt.branch}  ({wt.type})")
             raise typer.Exit(1)
         selected = match[0]
     elif is_interactive():
         choices = [_format_choice(wt) for wt in switchable]
         picked = fuzzy_select("Select a worktree:", choices)
-        selected = next(wt for wt in switchable if wt["path"] == picked)
+        by_path = {wt.path: wt for wt in switchable}
+        selected = by_path[picked]
     else:
         console.print("[red]No TTY — pass a branch name.[/red]")
         raise typer.Exit(1)
 
-    wt_path = Path(selected["path"])
+    wt_path = Path(selected.path)
     if not wt_path.exists():
         console.print(f"[red]Worktree directory does not exist: {wt_path}[/red]")
         raise typer.Exit(1)
 
-    branch = selected.get("branch", "(detached)")
+    branch = selected.branch
 
-    if selected["type"] == "temporary":
+    if selected.type == "temporary":
         console.print(
             "\n[yellow]Warning: This is a temporary worktree. It will"
             " be deleted when the original session exits.[/yellow]"
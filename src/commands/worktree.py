@@ -1,37 +1,126 @@
 import contextlib
+import dataclasses
+import fcntl
+import functools
 import hashlib
+import os
 import re
 import shutil
 import subprocess
 import tempfile
+from collections.abc import Generator, Iterator
 from pathlib import Path
+from typing import IO
 
 import typer
 from rich.console import Console
 
 from src.commands.git import git, should_sync
-from src.settings import DEP_SYMLINKS, PERSISTENT_WORKTREES_DIR
+from src.settings import DEP_SYMLINKS, PERSISTENT_WORKTREES_DIR, SKIP_PREFIXES
 
 
 console = Console()
 
 
+def _usable_cpu_count() -> int:
+    """Return the CPUs this process may run on (affinity-aware where supported)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# Upper bound on concurrent rsync processes used by sync_untracked_files.
+SYNC_WORKERS = min(8, _usable_cpu_count())
+
+
 def link_deps(repo: Path, worktree: Path) -> None:
     for rel_path in DEP_SYMLINKS:
         source = repo / rel_path
+        if not source.exists():
+            continue
         target = worktree / rel_path
-        if source.exists() and not target.exists():
-            target.symlink_to(source)
+        # An existing target (real dir or earlier link) is left alone; letting
+        # symlink_to fail saves a stat per dep on the common fresh-worktree path.
+        with contextlib.suppress(FileExistsError):
+            try:
+                target.symlink_to(source)
+            except FileNotFoundError:
+                # The parent only exists in the main repo as untracked files, and
+                # the sync that copies them may still be running.
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.symlink_to(source)
+
+
+def trust_mise_config(worktree: Path) -> None:
+    """Run `mise trust` in *worktree* if its mise.toml hasn't been trusted yet.
+
+    The digest of the last trusted mise.toml is kept in the worktree's git admin
+    dir, so re-entering an unchanged persistent worktree skips the subprocess and
+    the marker goes away with the worktree.
+    """
+    try:
+        config = (worktree / "mise.toml").read_bytes()
+    except FileNotFoundError:
+        return
+    digest = hashlib.blake2b(config, digest_size=16).hexdigest()
+    marker = _worktree_git_dir(worktree) / "claudway-mise-trusted"
+    with contextlib.suppress(OSError):
+        if marker.read_text() == digest:
+            return
+    # Looked up only once a trust is actually due; without mise there is
+    # nothing to trust and exec'ing it would raise FileNotFoundError.
+    mise = shutil.which("mise")
+    if mise is None:
+        return
+    result = subprocess.run(
+        [mise, "trust"],
+        cwd=worktree,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    if result.returncode == 0:
+        with contextlib.suppress(OSError):
+            marker.write_text(digest)
+
+
+def _worktree_git_dir(worktree: Path) -> Path:
+    """Return the git admin dir of *worktree* by reading its .git file."""
+    dot_git = worktree / ".git"
+    with contextlib.suppress(OSError):
+        content = dot_git.read_text().strip()
+        if content.startswith("gitdir: "):
+            return (worktree / content.removeprefix("gitdir: ")).resolve()
+    return dot_git
+
+
+def _has_admin_record(repo: Path, worktree: Path) -> bool:
+    """Return True if *repo* has a worktree admin dir that points back at *worktree*.
+
+    git worktree list builds its entries from <common dir>/worktrees/<id>/gitdir,
+    so a matching pair answers the question with a couple of file reads.
+    """
+    admin_dir = _worktree_git_dir(worktree)
+    if admin_dir.parent != (repo / ".git" / "worktrees").resolve():
+        return False
+    try:
+        linked = (admin_dir / "gitdir").read_text().strip()
+    except OSError:
+        return False
+    return Path(linked).resolve() == (worktree / ".git").resolve()
 
 
 def uncommitted_changes(worktree: Path) -> str:
     """Return porcelain status output, or empty string if clean."""
+    # Untracked files must stay listed (-unormal) since they are lost on cleanup,
+    # but the poll has no need to take the index lock to write back a refresh.
     result = subprocess.run(
         ["git", "-C", str(worktree), "status", "--porcelain", "-unormal"],
         capture_output=True,
         text=True,
+        env={**os.environ, "GIT_OPTIONAL_LOCKS": "0"},
     )
-    return result.stdout.strip()
+    # Only trailing whitespace: a leading space is part of the first status column
+    return result.stdout.rstrip()
 
 
 def cleanup_worktree(repo: Path, tmpdir: Path) -> None:
@@ -41,10 +130,29 @@ def cleanup_worktree(repo: Path, tmpdir: Path) -> None:
         shutil.rmtree(tmpdir, ignore_errors=True)
 
 
+# "'<branch>' is already checked out at '<path>'"; newer git says "used by
+# worktree" instead of "checked out".
+_CHECKED_OUT_AT_RE = re.compile(
+    r"already (?:checked out|used by worktree) at '(.+)'$", re.MULTILINE
+)
+
+
+@contextlib.contextmanager
+def _worktree_admin_lock(repo: Path) -> Generator[None]:
+    """Hold an exclusive lock shared by every claudway process working on *repo*."""
+    with (repo / ".git" / "claudway.lock").open("wb") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
 def create_worktree(repo: Path, tmpdir: Path, branch: str) -> None:
     """Create a git worktree. Raises WorktreeConflict if already checked out."""
     try:
-        git(repo, "worktree", "add", str(tmpdir), branch)
+        # Concurrent `go`s take turns adding their worktree, which makes git's
+        # already-checked-out check reliable. The checkout stays inside the add
+        # so post-checkout hooks still get the null old-oid of a new worktree.
+        with _worktree_admin_lock(repo):
+            git(repo, "worktree", "add", str(tmpdir), branch)
     except subprocess.CalledProcessError as e:
         stderr = (e.stderr or "").strip()
         already_used = (
@@ -53,7 +161,10 @@ def create_worktree(repo: Path, tmpdir: Path, branch: str) -> None:
         if not already_used:
             raise
 
-        conflict_path = find_conflicting_worktree(repo, branch)
+        # git names the worktree holding the branch; only enumerate all of
+        # them if the message doesn't carry a path.
+        match = _CHECKED_OUT_AT_RE.search(stderr)
+        conflict_path = match[1] if match else find_conflicting_worktree(repo, branch)
         if not conflict_path:
             console.print(f"\n[red]Error:[/red] {stderr}")
             raise typer.Exit(1) from None
@@ -72,18 +183,24 @@ class WorktreeConflictError(Exception):
 def find_conflicting_worktree(repo: Path, branch: str) -> str | None:
     """Return the path of an existing worktree that has *branch* checked out."""
     wt_list = git(repo, "worktree", "list", "--porcelain")
-    candidate = ""
-    for line in wt_list.stdout.splitlines():
-        if line.startswith("worktree "):
-            candidate = line.removeprefix("worktree ")
-        elif line.startswith("branch ") and line.endswith(f"/{branch}"):
-            return candidate
-    return None
+    # Find the exact branch line, then the worktree line that opens its record
+    text = "\n" + wt_list.stdout.rstrip("\n") + "\n"
+    branch_at = text.find(f"\nbranch refs/heads/{branch}\n")
+    if branch_at == -1:
+        return None
+    path_start = text.rfind("\nworktree ", 0, branch_at)
+    if path_start == -1:
+        return None
+    path_start += len("\nworktree ")
+    return text[path_start : text.index("\n", path_start)]
+
+
+_PATH_SEPARATORS_TO_DASH = str.maketrans({"/": "-", "\\": "-"})
 
 
 def sanitize_branch_name(branch: str) -> str:
     """Replace path separators in a branch name so it's safe for directory names."""
-    return re.sub(r"[/\\]", "-", branch)
+    return branch.translate(_PATH_SEPARATORS_TO_DASH)
 
 
 def persistent_worktree_dir(repo: Path, branch: str) -> Path:
@@ -94,8 +211,17 @@ def persistent_worktree_dir(repo: Path, branch: str) -> Path:
     return PERSISTENT_WORKTREES_DIR / f"{sanitized}-{short_hash}"
 
 
-def list_worktrees(repo: Path) -> list[dict[str, str]]:
-    """Return a list of worktree dicts with 'path', 'branch', and 'type' keys."""
+@dataclasses.dataclass(slots=True, frozen=True)
+class WorktreeRecord:
+    """One entry from ``git worktree list``, as returned by list_worktrees."""
+
+    path: str
+    branch: str
+    type: str
+
+
+def list_worktrees(repo: Path) -> list[WorktreeRecord]:
+    """Return the repo's worktrees with their branch and classification."""
     result = subprocess.run(
         ["git", "-C", str(repo), "worktree", "list", "--porcelain"],
         capture_output=True,
@@ -104,51 +230,65 @@ def list_worktrees(repo: Path) -> list[dict[str, str]]:
     if result.returncode != 0:
         return []
 
-    worktrees: list[dict[str, str]] = []
-    current: dict[str, str] = {}
-    for line in result.stdout.splitlines():
-        if line.startswith("worktree "):
-            current = {"path": line.removeprefix("worktree ")}
-        elif line.startswith("HEAD "):
-            current["head"] = line.removeprefix("HEAD ")
-        elif line.startswith("branch "):
-            current["branch"] = line.removeprefix("branch refs/heads/")
-        elif line == "detached":
-            head = current.get("head", "")
-            current["branch"] = f"(detached at {head[:7]})" if head else "(detached)"
-        elif line == "bare":
-            current["branch"] = "(bare)"
-        elif line == "" and current:
-            current.setdefault("branch", "(unknown)")
-            current["type"] = classify_worktree(repo, Path(current["path"]))
-            worktrees.append(current)
-            current = {}
-    if current:
-        current.setdefault("branch", "(unknown)")
-        current["type"] = classify_worktree(repo, Path(current["path"]))
-        worktrees.append(current)
+    # Resolved once here rather than once per worktree in classify_worktree
+    repo_resolved = os.path.realpath(repo)
+    worktrees: list[WorktreeRecord] = []
+    path: str | None = None
+    head = branch = ""
+    # The trailing "" closes the last record even if git omits the blank line
+    for line in (*result.stdout.splitlines(), ""):
+        # Each porcelain line is "<attribute>[ <value>]"
+        kind, _, value = line.partition(" ")
+        if kind == "worktree":
+            path, head, branch = value, "", "(unknown)"
+        elif kind == "HEAD":
+            head = value
+        elif kind == "branch":
+            branch = value.removeprefix("refs/heads/")
+        elif kind == "detached":
+            branch = f"(detached at {head[:7]})" if head else "(detached)"
+        elif kind == "bare":
+            branch = "(bare)"
+        elif not line and path is not None:
+            wt_type = _classify_resolved(repo_resolved, os.path.realpath(path))
+            worktrees.append(WorktreeRecord(path, branch, wt_type))
+            path = None
     return worktrees
 
 
 def classify_worktree(repo: Path, wt_path: Path) -> str:
     """Classify a worktree as 'main', 'persistent', or 'temporary'."""
-    try:
-        if wt_path.resolve() == repo.resolve():
-            return "main"
-    except OSError:
-        pass
-    wt_resolved = wt_path.resolve()
-    if wt_resolved.is_relative_to(PERSISTENT_WORKTREES_DIR.resolve()):
+    return _classify_resolved(os.path.realpath(repo), os.path.realpath(wt_path))
+
+
+@functools.cache
+def _classify_roots() -> tuple[str, str]:
+    """Return the resolved persistent and temp roots, each ending in a separator."""
+    return (
+        os.path.join(os.path.realpath(PERSISTENT_WORKTREES_DIR), ""),
+        os.path.join(os.path.realpath(tempfile.gettempdir()), ""),
+    )
+
+
+def _classify_resolved(repo_resolved: str, wt_resolved: str) -> str:
+    """classify_worktree for paths that have already been resolved.
+
+    Works on plain strings so classifying a worktree list builds no Path objects.
+    """
+    if wt_resolved == repo_resolved:
+        return "main"
+    persistent_root, tmp_root = _classify_roots()
+    if wt_resolved.startswith(persistent_root):
         return "persistent"
-    tmpdir = Path(tempfile.gettempdir()).resolve()
-    wt_resolved_str = str(wt_resolved)
-    if wt_resolved_str.startswith(str(tmpdir)) and "/cw-" in wt_resolved_str:
+    if wt_resolved.startswith(tmp_root) and "/cw-" in wt_resolved:
         return "temporary"
     return "unknown"
 
 
 def is_valid_worktree(repo: Path, path: Path) -> bool:
     """Check if the given path is registered in git worktree list."""
+    if _has_admin_record(repo, path):
+        return True
     result = subprocess.run(
         ["git", "-C", str(repo), "worktree", "list", "--porcelain"],
         capture_output=True,
@@ -164,20 +304,152 @@ def is_valid_worktree(repo: Path, path: Path) -> bool:
     return False
 
 
-def sync_untracked_files(repo: Path, worktree: Path) -> None:
-    """Rsync untracked (non-ignored) files from *repo* into *worktree*."""
-    untracked = git(repo, "ls-files", "--others")
-    filtered = "\n".join(p for p in untracked.stdout.splitlines() if should_sync(p))
-    if filtered:
-        subprocess.run(
-            [
-                "rsync",
-                "-a",
-                "--files-from=-",
-                f"{repo}/",
-                f"{worktree}/",
-            ],
-            input=filtered,
-            text=True,
-            check=False,
+def _iter_nul_separated(
+    stream: IO[bytes], chunk_size: int = 1 << 16
+) -> Iterator[bytes]:
+    """Yield NUL-terminated entries from *stream* as they arrive."""
+    pending = b""
+    while chunk := stream.read(chunk_size):
+        *entries, pending = (pending + chunk).split(b"\0")
+        yield from entries
+    if pending:
+        yield pending
+
+
+def _start_rsync(repo: Path, worktree: Path, inplace: bool) -> subprocess.Popen[bytes]:
+    return subprocess.Popen(
+        [
+            "rsync",
+            "-a",
+            # Local-to-local already implies this; be explicit that the delta
+            # algorithm is never worth running against a fresh worktree.
+            "--whole-file",
+            # Skip the write-to-temp-then-rename dance for every file when
+            # nothing else can be reading the worktree yet.
+            *(["--inplace"] if inplace else []),
+            "--from0",
+            "--files-from=-",
+            f"{repo}/",
+            f"{worktree}/",
+        ],
+        stdin=subprocess.PIPE,
+    )
+
+
+def _copy_untracked(
+    repo: Path, worktree: Path, paths: list[bytes], inplace: bool
+) -> None:
+    """Copy a few untracked paths in-process, the way rsync -a would."""
+    repo_root, worktree_root = os.fsencode(repo), os.fsencode(worktree)
+    for path in paths:
+        source = os.path.join(repo_root, path)
+        target = os.path.join(worktree_root, path)
+        try:
+            if path.endswith(b"/"):
+                # A nested repository: git lists just its directory, and rsync
+                # creates it empty
+                os.makedirs(target, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if inplace:
+                # Replace symlinks rather than writing through them, and copy
+                # symlinks as links, like rsync -a.
+                if os.path.islink(source) or os.path.islink(target):
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(target)
+                shutil.copy2(source, target, follow_symlinks=False)
+            else:
+                # Rename a finished copy over the target so readers never see
+                # a half-written file, like rsync without --inplace.
+                staging = target + b".cw-partial"
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(staging)
+                shutil.copy2(source, staging, follow_symlinks=False)
+                os.replace(staging, target)
+        except OSError as e:
+            # rsync reports unreadable or vanished files and carries on
+            console.print(f"[yellow]Could not copy {os.fsdecode(path)}: {e}[/yellow]")
+
+
+# Untracked sets up to this size are copied in-process: spawning rsync would
+# cost more than the copy itself.
+_INPROCESS_COPY_LIMIT = 32
+
+
+def sync_untracked_files(repo: Path, worktree: Path, *, inplace: bool = True) -> None:
+    """Rsync untracked (including ignored) files from *repo* into *worktree*.
+
+    The git listing is streamed, as raw bytes, straight into rsync's stdin.
+    Pass inplace=False if something may already be reading the worktree.
+    """
+    # Excluding the skipped directories here stops git from walking into them at
+    # all; should_sync still catches the file-level skips, which as git patterns
+    # would also prune directories like data.db/. Dep dirs are symlinked in by
+    # link_deps afterwards, so there's no point copying them either.
+    excludes = [
+        *(f"--exclude={prefix}" for prefix in SKIP_PREFIXES),
+        *(f"--exclude=/{rel_path}/" for rel_path in DEP_SYMLINKS),
+    ]
+    # git's warnings go to a file: a stderr pipe nobody reads until stdout hits
+    # EOF would stall git once it filled, and with it the whole sync.
+    with tempfile.TemporaryFile() as ls_errors:
+        ls_files = subprocess.Popen(
+            ["git", "-C", str(repo), "ls-files", "--others", "-z", *excludes],
+            stdout=subprocess.PIPE,
+            stderr=ls_errors,
         )
+        assert ls_files.stdout is not None
+        # Up to SYNC_WORKERS rsyncs, bucketed by top-level directory so each one
+        # creates a disjoint set of directories. Each starts on its first path.
+        workers: dict[int, subprocess.Popen[bytes]] = {}
+        exited: set[int] = set()
+
+        def send(path: bytes) -> None:
+            top_level = path.partition(b"/")[0] if b"/" in path else b""
+            bucket = hash(top_level) % SYNC_WORKERS
+            if bucket in exited:
+                return
+            rsync = workers.get(bucket)
+            if rsync is None:
+                rsync = workers[bucket] = _start_rsync(repo, worktree, inplace)
+            assert rsync.stdin is not None
+            try:
+                rsync.stdin.write(path + b"\0")
+            except BrokenPipeError:
+                # This rsync has already exited and reported why on stderr; the
+                # listing still has to be drained and the other workers fed.
+                exited.add(bucket)
+
+        # The first _INPROCESS_COPY_LIMIT paths are held back; if the listing ends
+        # there, they're copied in-process and no rsync is started at all.
+        held: list[bytes] | None = []
+        for path in _iter_nul_separated(ls_files.stdout):
+            if not path or not should_sync(path):
+                continue
+            if held is None:
+                send(path)
+            elif len(held) < _INPROCESS_COPY_LIMIT:
+                held.append(path)
+            else:
+                for held_path in held:
+                    send(held_path)
+                held = None
+                send(path)
+        if held:
+            _copy_untracked(repo, worktree, held, inplace)
+        for rsync in workers.values():
+            assert rsync.stdin is not None
+            with contextlib.suppress(BrokenPipeError):
+                rsync.stdin.close()
+        for rsync in workers.values():
+            rsync.wait()
+
+        ls_files.stdout.close()
+        ls_files.wait()
+        if ls_files.returncode != 0:
+            ls_errors.seek(0)
+            raise subprocess.CalledProcessError(
+                ls_files.returncode,
+                ls_files.args,
+                stderr=ls_errors.read().decode(errors="replace"),
+            )
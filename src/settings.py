@@ -1,10 +1,10 @@
+import dataclasses
+import functools
 import tomllib
 from pathlib import Path
 from typing import Any
 
-import tomli_w
 import typer
-from pydantic import BaseModel
 
 
 CONFIG_DIR = Path.home() / ".config" / "claudway"
@@ -12,21 +12,35 @@ CONFIG_FILE = CONFIG_DIR / "config.toml"
 PERSISTENT_WORKTREES_DIR = Path.home() / ".local" / "share" / "claudway" / "worktrees"
 
 
-class ClaudwaySettings(BaseModel):
+@dataclasses.dataclass
+class ClaudwaySettings:
     default_command: str = "claude"
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.default_command, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise ValueError("default_command must be a string")
+
     @classmethod
+    @functools.cache
     def load(cls) -> "ClaudwaySettings":
-        """Load settings from the TOML config file."""
+        """Load settings from the TOML config file, once per process."""
         if not CONFIG_FILE.exists():
             return cls()
         try:
-            data = tomllib.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+            with CONFIG_FILE.open("rb") as f:
+                data = tomllib.load(f)
         except (tomllib.TOMLDecodeError, UnicodeDecodeError) as e:
             typer.echo(f"Error: failed to parse config at {CONFIG_FILE}: {e}")
             typer.echo("Fix or remove the file, then try again.")
             raise typer.Exit(1) from None
-        return cls.model_validate(data)
+        # Keys this version doesn't know about are ignored
+        known = {field.name for field in dataclasses.fields(cls)}
+        try:
+            return cls(**{k: v for k, v in data.items() if k in known})
+        except ValueError as e:
+            typer.echo(f"Error: invalid config at {CONFIG_FILE}: {e}")
+            typer.echo("Fix or remove the file, then try again.")
+            raise typer.Exit(1) from None
 
 
 # Directory prefixes to skip when syncing untracked files.
@@ -57,15 +71,19 @@ DEP_SYMLINKS = (
 
 def save_setting(key: str, value: str) -> None:
     """Persist a single setting to the TOML config file."""
+    import tomli_w
+
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
     data: dict[str, Any] = {}
     if CONFIG_FILE.exists():
         try:
-            data = tomllib.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+            with CONFIG_FILE.open("rb") as f:
+                data = tomllib.load(f)
         except (tomllib.TOMLDecodeError, UnicodeDecodeError) as e:
             typer.echo(f"Warning: failed to parse config at {CONFIG_FILE}: {e}")
             typer.echo("Overwriting with new config.")
             data = {}
     data[key] = value
     CONFIG_FILE.write_bytes(tomli_w.dumps(data).encode())
+    ClaudwaySettings.load.cache_clear()
@@ -0,0 +1,42 @@
+"""Shared fixtures for command tests."""
+
+import subprocess
+from collections.abc import Callable
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture
+def porcelain_two() -> str:
+    """Porcelain output for the main checkout plus one temporary worktree."""
+    return (
+        "worktree /home/user/repo\n"
+        "HEAD abc123\n"
+        "branch refs/heads/main\n"
+        "\n"
+        "worktree /tmp/cw-xyz\n"
+        "HEAD def456\n"
+        "branch refs/heads/feature\n"
+        "\n"
+    )
+
+
+@pytest.fixture
+def mock_subprocess_run(monkeypatch: pytest.MonkeyPatch) -> Callable[..., Mock]:
+    """Return a factory that stubs subprocess.run with a canned result.
+
+    The stub replaces subprocess.run itself, so every subprocess.run call made
+    during the test gets the same result. The factory returns the stub for
+    assertions on how it was called.
+    """
+
+    def _factory(stdout: str = "", returncode: int = 0) -> Mock:
+        result = subprocess.CompletedProcess(
+            args=[], returncode=returncode, stdout=stdout, stderr=""
+        )
+        mock_run = Mock(return_value=result)
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        return mock_run
+
+    return _factory
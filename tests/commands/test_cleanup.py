@@ -14,3 +14,18 @@ class TestPrintChangeSummary:
         print_change_summary(lines)
         captured = capsys.readouterr()
         assert "and 5 more" in captured.out
+
+    def test_no_more_line_at_limit(self, capsys: pytest.CaptureFixture[str]) -> None:
+        lines = "\n".join(f"M  file{i}.py" for i in range(15))
+        print_change_summary(lines)
+        captured = capsys.readouterr()
+        assert "file14.py" in captured.out
+        assert "more" not in captured.out
+
+    def test_parses_unstaged_status_column(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        print_change_summary(" M src/app.py\nA  new.py")
+        captured = capsys.readouterr()
+        assert " M src/app.py" in captured.out
+        assert "A  new.py" in captured.out
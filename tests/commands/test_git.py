@@ -7,9 +7,11 @@ from unittest.mock import patch
 import pytest
 
 from src.commands.git import (
+    _detect_repo,
+    detect_repo,
     ensure_branch,
-    list_local_branches,
-    list_remote_branches,
+    get_current_branch,
+    list_branches,
     should_sync,
 )
 from src.settings import SKIP_NAMES, SKIP_PREFIXES, SKIP_SUFFIXES
@@ -37,6 +39,24 @@ class TestShouldSync:
     def test_prefix_match_is_substring(self) -> None:
         assert should_sync("web/node_modules/pkg/index.js") is False
 
+    @pytest.mark.parametrize("name", SKIP_NAMES)
+    def test_skip_names_at_top_level(self, name: str) -> None:
+        assert should_sync(name) is False
+
+    def test_name_must_match_whole_basename(self) -> None:
+        assert should_sync("dir/not.DS_Store") is True
+
+    @pytest.mark.parametrize("path", ["foo.pyc\n", ".DS_Store\n"])
+    def test_trailing_newline_is_part_of_the_name(self, path: str) -> None:
+        assert should_sync(path) is True
+        assert should_sync(path.encode()) is True
+
+    def test_bytes_paths(self) -> None:
+        assert should_sync(b"src/main.py") is True
+        assert should_sync(b"web/node_modules/pkg/index.js") is False
+        assert should_sync(b"dir/.DS_Store") is False
+        assert should_sync(b"data/file.db") is False
+
 
 def _make_completed(
     stdout: str = "", returncode: int = 0
@@ -49,46 +69,45 @@ def _make_completed(
 REPO = Path("/fake/repo")
 
 
-class TestListLocalBranches:
-    @patch("src.commands.git.git")
-    def test_returns_branches_sorted(self, mock_git: patch) -> None:  # type: ignore[type-arg]
-        mock_git.return_value = _make_completed("main\nfeature/a\ndev\n")
-        result = list_local_branches(REPO)
-        assert result == ["main", "feature/a", "dev"]
-
-    @patch("src.commands.git.git")
-    def test_returns_empty_on_error(self, mock_git: patch) -> None:  # type: ignore[type-arg]
-        mock_git.side_effect = subprocess.CalledProcessError(1, [])
-        assert list_local_branches(REPO) == []
-
-    @patch("src.commands.git.git")
-    def test_filters_empty_lines(self, mock_git: patch) -> None:  # type: ignore[type-arg]
-        mock_git.return_value = _make_completed("main\n\ndev\n")
-        assert list_local_branches(REPO) == ["main", "dev"]
+class TestGitProbeCaching:
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self) -> None:
+        _detect_repo.cache_clear()
+        get_current_branch.cache_clear()
 
+    @patch("src.commands.git.subprocess.run")
+    def test_detect_repo_runs_git_once(self, mock_run: patch) -> None:  # type: ignore[type-arg]
+        mock_run.return_value = _make_completed("/fake/repo/.git\n")
+        assert detect_repo() == REPO
+        assert detect_repo() == REPO
+        mock_run.assert_called_once()
 
-class TestListRemoteBranches:
-    @patch("src.commands.git.git")
-    def test_strips_remote_prefix(self, mock_git: patch) -> None:  # type: ignore[type-arg]
-        mock_git.return_value = _make_completed("origin/main\norigin/feature\n")
-        assert list_remote_branches(REPO) == ["main", "feature"]
+    @patch("src.commands.git.subprocess.run")
+    def test_current_branch_runs_git_once(self, mock_run: patch) -> None:  # type: ignore[type-arg]
+        mock_run.return_value = _make_completed("main\n")
+        assert get_current_branch(REPO) == "main"
+        assert get_current_branch(REPO) == "main"
+        mock_run.assert_called_once()
 
-    @patch("src.commands.git.git")
-    def test_filters_head(self, mock_git: patch) -> None:  # type: ignore[type-arg]
-        mock_git.return_value = _make_completed("origin/HEAD\norigin/main\n")
-        assert list_remote_branches(REPO) == ["main"]
 
+class TestListBranches:
     @patch("src.commands.git.git")
-    def test_ignores_non_origin_remotes(self, mock_git: patch) -> None:  # type: ignore[type-arg]
+    def test_splits_local_and_origin(self, mock_git: patch) -> None:  # type: ignore[type-arg]
         mock_git.return_value = _make_completed(
-            "origin/main\nupstream/main\nupstream/feature\norigin/dev\n"
+            "refs/heads/main\n"
+            "refs/remotes/origin/feature\n"
+            "refs/heads/feature/a\n"
+            "refs/remotes/origin/HEAD\n"
+            "refs/remotes/origin/main\n"
         )
-        assert list_remote_branches(REPO) == ["main", "dev"]
+        local, remote = list_branches(REPO)
+        assert local == ["main", "feature/a"]
+        assert remote == ["feature", "main"]
 
     @patch("src.commands.git.git")
     def test_returns_empty_on_error(self, mock_git: patch) -> None:  # type: ignore[type-arg]
         mock_git.side_effect = subprocess.CalledProcessError(1, [])
-        assert list_remote_branches(REPO) == []
+        assert list_branches(REPO) == ([], [])
 
 
 class TestEnsureBranch:
@@ -101,17 +120,30 @@ class TestEnsureBranch:
         assert ensure_branch(REPO, "origin/feature") == "feature"
 
     @patch("src.commands.git.git")
-    @patch("src.commands.git.branch_exists")
+    @patch("src.commands.git.branch_exists", return_value=False)
     def test_creates_tracking_branch_for_remote(
         self,
-        mock_exists: patch,
+        _mock_exists: patch,
         mock_git: patch,  # type: ignore[type-arg]
     ) -> None:
-        # First call: local branch doesn't exist; second: remote ref exists
-        mock_exists.side_effect = [False, True]
         mock_git.return_value = _make_completed()
         result = ensure_branch(REPO, "feature")
         assert result == "feature"
         mock_git.assert_called_once_with(
             REPO, "branch", "--track", "feature", "origin/feature"
         )
+
+    @patch("src.commands.git.typer.confirm", return_value=True)
+    @patch("src.commands.git.git")
+    @patch("src.commands.git.branch_exists", return_value=False)
+    def test_creates_new_branch_without_remote(
+        self,
+        _mock_exists: patch,
+        mock_git: patch,  # type: ignore[type-arg]
+        _mock_confirm: patch,  # type: ignore[type-arg]
+    ) -> None:
+        # The --track attempt fails because origin/feature doesn't exist
+        mock_git.side_effect = [subprocess.CalledProcessError(128, []), None]
+        result = ensure_branch(REPO, "feature", base="main")
+        assert result == "feature"
+        mock_git.assert_called_with(REPO, "branch", "feature", "main")
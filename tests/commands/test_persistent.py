@@ -1,8 +1,9 @@
 """Tests for persistent worktree helpers and new commands."""
 
 import tempfile
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock
 
 from src.commands.worktree import (
     classify_worktree,
@@ -25,6 +26,11 @@ class TestPersistentWorktreeDir:
         result = persistent_worktree_dir(repo, "feature/foo")
         assert "feature-foo-" in result.name
 
+    def test_sanitizes_backslashes(self) -> None:
+        repo = Path("/home/user/repo")
+        result = persistent_worktree_dir(repo, "feature\\foo")
+        assert "feature-foo-" in result.name
+
     def test_different_repos_different_dirs(self) -> None:
         result1 = persistent_worktree_dir(Path("/repo1"), "main")
         result2 = persistent_worktree_dir(Path("/repo2"), "main")
@@ -57,6 +63,11 @@ class TestClassifyWorktree:
         tmpdir = Path(tempfile.gettempdir()) / "cw-xyz123"
         assert classify_worktree(repo, tmpdir) == "temporary"
 
+    def test_temp_dir_sibling_is_not_temporary(self) -> None:
+        repo = Path("/home/user/repo")
+        sibling = Path(f"{Path(tempfile.gettempdir()).resolve()}-other") / "cw-xyz123"
+        assert classify_worktree(repo, sibling) == "unknown"
+
     def test_unknown_worktree(self) -> None:
         repo = Path("/home/user/repo")
         wt_path = Path("/some/random/path")
@@ -64,30 +75,20 @@ class TestClassifyWorktree:
 
 
 class TestListWorktrees:
-    def test_parses_porcelain(self) -> None:
-        porcelain = (
-            "worktree /home/user/repo\n"
-            "HEAD abc123\n"
-            "branch refs/heads/main\n"
-            "\n"
-            "worktree /tmp/cw-xyz\n"
-            "HEAD def456\n"
-            "branch refs/heads/feature\n"
-            "\n"
-        )
-        with patch("src.commands.worktree.subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = porcelain
-            result = list_worktrees(Path("/home/user/repo"))
+    def test_parses_porcelain(
+        self, mock_subprocess_run: Callable[..., Mock], porcelain_two: str
+    ) -> None:
+        mock_subprocess_run(porcelain_two)
+        result = list_worktrees(Path("/home/user/repo"))
 
         assert len(result) == 2
-        assert result[0]["path"] == "/home/user/repo"
-        assert result[0]["branch"] == "main"
-        assert result[0]["type"] == "main"
-        assert result[1]["path"] == "/tmp/cw-xyz"
-        assert result[1]["branch"] == "feature"
+        assert result[0].path == "/home/user/repo"
+        assert result[0].branch == "main"
+        assert result[0].type == "main"
+        assert result[1].path == "/tmp/cw-xyz"
+        assert result[1].branch == "feature"
 
-    def test_detached_worktree(self) -> None:
+    def test_detached_worktree(self, mock_subprocess_run: Callable[..., Mock]) -> None:
         porcelain = (
             "worktree /home/user/repo\n"
             "HEAD abc1234567890\n"
@@ -98,53 +99,41 @@ class TestListWorktrees:
             "detached\n"
             "\n"
         )
-        with patch("src.commands.worktree.subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = porcelain
-            result = list_worktrees(Path("/home/user/repo"))
+        mock_subprocess_run(porcelain)
+        result = list_worktrees(Path("/home/user/repo"))
 
         assert len(result) == 2
-        assert result[1]["branch"] == "(detached at def4567)"
-        assert result[1]["path"] == "/tmp/cw-detached"
-
-    def test_empty_on_failure(self) -> None:
-        with patch("src.commands.worktree.subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 1
-            mock_run.return_value.stdout = ""
-            result = list_worktrees(Path("/repo"))
+        assert result[1].branch == "(detached at def4567)"
+        assert result[1].path == "/tmp/cw-detached"
+
+    def test_empty_on_failure(self, mock_subprocess_run: Callable[..., Mock]) -> None:
+        mock_subprocess_run(returncode=1)
+        result = list_worktrees(Path("/repo"))
         assert result == []
 
-    def test_includes_type(self) -> None:
+    def test_includes_type(self, mock_subprocess_run: Callable[..., Mock]) -> None:
         persistent_path = str(PERSISTENT_WORKTREES_DIR / "feat-12345678")
         porcelain = (
             f"worktree {persistent_path}\nHEAD abc123\nbranch refs/heads/feat\n\n"
         )
-        with patch("src.commands.worktree.subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = porcelain
-            result = list_worktrees(Path("/repo"))
+        mock_subprocess_run(porcelain)
+        result = list_worktrees(Path("/repo"))
 
-        assert result[0]["type"] == "persistent"
+        assert result[0].type == "persistent"
 
 
 class TestIsValidWorktree:
-    def test_found(self) -> None:
+    def test_found(self, mock_subprocess_run: Callable[..., Mock]) -> None:
         porcelain = "worktree /tmp/cw-xyz\nHEAD abc\nbranch refs/heads/main\n"
-        with patch("src.commands.worktree.subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = porcelain
-            # Use the exact path so resolve() matches
-            assert is_valid_worktree(Path("/repo"), Path("/tmp/cw-xyz")) is True
+        mock_subprocess_run(porcelain)
+        # Use the exact path so resolve() matches
+        assert is_valid_worktree(Path("/repo"), Path("/tmp/cw-xyz")) is True
 
-    def test_not_found(self) -> None:
+    def test_not_found(self, mock_subprocess_run: Callable[..., Mock]) -> None:
         porcelain = "worktree /tmp/cw-other\nHEAD abc\nbranch refs/heads/main\n"
-        with patch("src.commands.worktree.subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 0
-            mock_run.return_value.stdout = porcelain
-            assert is_valid_worktree(Path("/repo"), Path("/tmp/cw-xyz")) is False
-
-    def test_git_failure(self) -> None:
-        with patch("src.commands.worktree.subprocess.run") as mock_run:
-            mock_run.return_value.returncode = 1
-            mock_run.return_value.stdout = ""
-            assert is_valid_worktree(Path("/repo"), Path("/tmp/cw-xyz")) is False
+        mock_subprocess_run(porcelain)
+        assert is_valid_worktree(Path("/repo"), Path("/tmp/cw-xyz")) is False
+
+    def test_git_failure(self, mock_subprocess_run: Callable[..., Mock]) -> None:
+        mock_subprocess_run(returncode=1)
+        assert is_valid_worktree(Path("/repo"), Path("/tmp/cw-xyz")) is False
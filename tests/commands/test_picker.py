@@ -0,0 +1,31 @@
+"""Tests for src.commands.picker."""
+
+from unittest.mock import patch
+
+from src.commands.picker import fuzzy_select
+
+
+class TestFuzzySelect:
+    def test_single_string_choice_skips_picker(self) -> None:
+        with patch("InquirerPy.inquirer.fuzzy") as mock_fuzzy:
+            assert fuzzy_select("Pick:", ["main"]) == "main"
+        mock_fuzzy.assert_not_called()
+
+    def test_single_dict_choice_returns_value(self) -> None:
+        choice = {"name": "main  (main)  /repo", "value": "/repo"}
+        with patch("InquirerPy.inquirer.fuzzy") as mock_fuzzy:
+            assert fuzzy_select("Pick:", [choice]) == "/repo"
+        mock_fuzzy.assert_not_called()
+
+    def test_single_choice_picker_when_requested(self) -> None:
+        with patch("InquirerPy.inquirer.fuzzy") as mock_fuzzy:
+            mock_fuzzy.return_value.execute.return_value = "main"
+            result = fuzzy_select("Pick:", ["main"], auto_select_single=False)
+        assert result == "main"
+        mock_fuzzy.assert_called_once()
+
+    def test_multiple_choices_use_picker(self) -> None:
+        with patch("InquirerPy.inquirer.fuzzy") as mock_fuzzy:
+            mock_fuzzy.return_value.execute.return_value = "dev"
+            assert fuzzy_select("Pick:", ["main", "dev"]) == "dev"
+        mock_fuzzy.assert_called_once()
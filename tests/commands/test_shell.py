@@ -1,8 +1,12 @@
 """Tests for src.commands.shell."""
 
-from unittest.mock import patch
+import subprocess
+from pathlib import Path
+from unittest.mock import call, patch
 
-from src.commands.shell import build_shell_env
+import pytest
+
+from src.commands.shell import agent_argv, build_shell_env, run_agent
 
 
 class TestBuildShellEnv:
@@ -19,3 +23,49 @@ class TestBuildShellEnv:
             env = build_shell_env()
             assert "claudway" not in env["PATH"]
             assert "/usr/bin" in env["PATH"]
+
+
+class TestAgentArgv:
+    def test_plain_command(self) -> None:
+        assert agent_argv("claude") == ["claude"]
+
+    def test_command_with_args(self) -> None:
+        assert agent_argv("cursor .") == ["cursor", "."]
+
+    def test_quoted_args(self) -> None:
+        assert agent_argv("claude 'fix the tests'") == ["claude", "fix the tests"]
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "claude && echo done",
+            "claude | tee log",
+            "code $PWD",
+            "~/bin/agent",
+            "FOO=1 claude",
+            "claude 'unterminated",
+            "",
+        ],
+    )
+    def test_needs_shell(self, command: str) -> None:
+        assert agent_argv(command) is None
+
+
+class TestRunAgent:
+    @patch("src.commands.shell.subprocess.run")
+    def test_execs_plain_command_directly(self, mock_run: patch) -> None:  # type: ignore[type-arg]
+        run_agent("claude", Path("/wt"))
+        mock_run.assert_called_once_with(["claude"], cwd=Path("/wt"))
+
+    @pytest.mark.parametrize("error", [FileNotFoundError, PermissionError])
+    @patch("src.commands.shell.subprocess.run")
+    def test_falls_back_to_shell_when_exec_fails(
+        self,
+        mock_run: patch,  # type: ignore[type-arg]
+        error: type[OSError],
+    ) -> None:
+        mock_run.side_effect = [error(), subprocess.CompletedProcess([], 0)]
+        run_agent("claude", Path("/wt"))
+        assert mock_run.call_args_list[-1] == call(
+            "claude", cwd=Path("/wt"), shell=True
+        )
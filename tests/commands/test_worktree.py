@@ -1,21 +1,45 @@
 """Tests for src.commands.worktree."""
 
+import shutil
+import subprocess
+from collections.abc import Callable, Iterator
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
-from src.commands.worktree import find_conflicting_worktree
+import pytest
+
+from src.commands.git import git
+from src.commands.worktree import (
+    WorktreeConflictError,
+    _start_rsync,
+    create_worktree,
+    find_conflicting_worktree,
+    is_valid_worktree,
+    link_deps,
+    sync_untracked_files,
+    trust_mise_config,
+    uncommitted_changes,
+)
+from src.settings import DEP_SYMLINKS
 
 
 class TestFindConflictingWorktree:
-    def test_finds_conflict(self) -> None:
+    def test_finds_conflict(self, porcelain_two: str) -> None:
+        with patch("src.commands.worktree.git") as mock_git:
+            mock_git.return_value.stdout = porcelain_two
+            result = find_conflicting_worktree(Path("/repo"), "feature")
+            assert result == "/tmp/cw-xyz"
+
+    def test_ignores_branch_with_matching_suffix(self) -> None:
         porcelain = (
-            "worktree /home/user/repo\n"
+            "worktree /tmp/cw-abc\n"
             "HEAD abc123\n"
-            "branch refs/heads/main\n"
+            "branch refs/heads/user/feature\n"
             "\n"
             "worktree /tmp/cw-xyz\n"
             "HEAD def456\n"
             "branch refs/heads/feature\n"
+            "\n"
         )
         with patch("src.commands.worktree.git") as mock_git:
             mock_git.return_value.stdout = porcelain
@@ -28,3 +52,269 @@ class TestFindConflictingWorktree:
             mock_git.return_value.stdout = porcelain
             result = find_conflicting_worktree(Path("/repo"), "feature")
             assert result is None
+
+
+class TestLinkDeps:
+    def test_links_present_deps(self, tmp_path: Path) -> None:
+        repo, worktree = tmp_path / "repo", tmp_path / "wt"
+        rel_path = DEP_SYMLINKS[0]
+        (repo / rel_path).mkdir(parents=True)
+        (worktree / rel_path).parent.mkdir(parents=True)
+        link_deps(repo, worktree)
+        assert (worktree / rel_path).resolve() == (repo / rel_path).resolve()
+
+    def test_creates_missing_parent(self, tmp_path: Path) -> None:
+        repo, worktree = tmp_path / "repo", tmp_path / "wt"
+        rel_path = DEP_SYMLINKS[0]
+        (repo / rel_path).mkdir(parents=True)
+        worktree.mkdir()
+        link_deps(repo, worktree)
+        assert (worktree / rel_path).is_symlink()
+
+    def test_leaves_existing_target(self, tmp_path: Path) -> None:
+        repo, worktree = tmp_path / "repo", tmp_path / "wt"
+        rel_path = DEP_SYMLINKS[0]
+        (repo / rel_path).mkdir(parents=True)
+        (worktree / rel_path).mkdir(parents=True)
+        link_deps(repo, worktree)
+        assert not (worktree / rel_path).is_symlink()
+
+
+def _make_linked_worktree(tmp_path: Path) -> Path:
+    worktree = tmp_path / "wt"
+    git_dir = tmp_path / "repo" / ".git" / "worktrees" / "wt"
+    git_dir.mkdir(parents=True)
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {git_dir}\n")
+    return worktree
+
+
+class TestTrustMiseConfig:
+    @pytest.fixture(autouse=True)
+    def _mise_installed(self) -> Iterator[None]:
+        with patch("src.commands.worktree.shutil.which", return_value="/bin/mise"):
+            yield
+
+    def test_skips_without_mise_toml(
+        self, tmp_path: Path, mock_subprocess_run: Callable[..., Mock]
+    ) -> None:
+        worktree = _make_linked_worktree(tmp_path)
+        mock_run = mock_subprocess_run()
+        trust_mise_config(worktree)
+        mock_run.assert_not_called()
+
+    def test_skips_without_mise_binary(
+        self, tmp_path: Path, mock_subprocess_run: Callable[..., Mock]
+    ) -> None:
+        worktree = _make_linked_worktree(tmp_path)
+        (worktree / "mise.toml").write_text("[tools]\n")
+        mock_run = mock_subprocess_run()
+        with patch("src.commands.worktree.shutil.which", return_value=None):
+            trust_mise_config(worktree)
+        mock_run.assert_not_called()
+
+    def test_trusts_once_per_content(
+        self, tmp_path: Path, mock_subprocess_run: Callable[..., Mock]
+    ) -> None:
+        worktree = _make_linked_worktree(tmp_path)
+        (worktree / "mise.toml").write_text("[tools]\n")
+        mock_run = mock_subprocess_run()
+        trust_mise_config(worktree)
+        trust_mise_config(worktree)
+        mock_run.assert_called_once()
+
+    def test_retrusts_changed_config(
+        self, tmp_path: Path, mock_subprocess_run: Callable[..., Mock]
+    ) -> None:
+        worktree = _make_linked_worktree(tmp_path)
+        (worktree / "mise.toml").write_text("[tools]\n")
+        mock_run = mock_subprocess_run()
+        trust_mise_config(worktree)
+        (worktree / "mise.toml").write_text('[tools]\nnode = "22"\n')
+        trust_mise_config(worktree)
+        assert mock_run.call_count == 2
+
+
+def _init_repo(repo: Path) -> None:
+    repo.mkdir()
+    (repo / "README.md").write_text("hello\n")
+    for args in (
+        ["init", "-q", "-b", "main"],
+        ["add", "README.md"],
+        ["-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init"],
+        ["branch", "feature"],
+    ):
+        subprocess.run(["git", "-C", str(repo), *args], check=True)
+
+
+class TestCreateWorktree:
+    def test_checks_out_branch(self, tmp_path: Path) -> None:
+        repo, worktree = tmp_path / "repo", tmp_path / "wt"
+        _init_repo(repo)
+        create_worktree(repo, worktree, "feature")
+        assert (worktree / "README.md").read_text() == "hello\n"
+        assert uncommitted_changes(worktree) == ""
+
+    def test_post_checkout_hook_gets_null_old_oid(self, tmp_path: Path) -> None:
+        repo, worktree = tmp_path / "repo", tmp_path / "wt"
+        _init_repo(repo)
+        hook = repo / ".git" / "hooks" / "post-checkout"
+        hook.parent.mkdir(exist_ok=True)
+        hook.write_text(f'#!/bin/sh\necho "$@" >> {tmp_path / "hook.log"}\n')
+        hook.chmod(0o755)
+        create_worktree(repo, worktree, "feature")
+        head = git(repo, "rev-parse", "feature").stdout.strip()
+        assert (tmp_path / "hook.log").read_text() == f"{'0' * 40} {head} 1\n"
+
+    def test_branch_in_use_raises_conflict(self, tmp_path: Path) -> None:
+        repo = tmp_path / "repo"
+        _init_repo(repo)
+        create_worktree(repo, tmp_path / "wt", "feature")
+        with pytest.raises(WorktreeConflictError) as excinfo:
+            create_worktree(repo, tmp_path / "wt2", "feature")
+        assert Path(excinfo.value.existing_path) == (tmp_path / "wt").resolve()
+
+    def test_conflict_path_read_from_git_error(self, tmp_path: Path) -> None:
+        error = subprocess.CalledProcessError(
+            128,
+            [],
+            stderr="fatal: 'feature' is already used by worktree at '/wt/feature'\n",
+        )
+        (tmp_path / ".git").mkdir()
+        with (
+            patch("src.commands.worktree.git", side_effect=error),
+            patch("src.commands.worktree.find_conflicting_worktree") as mock_find,
+            pytest.raises(WorktreeConflictError) as excinfo,
+        ):
+            create_worktree(tmp_path, tmp_path / "wt", "feature")
+        assert excinfo.value.existing_path == "/wt/feature"
+        mock_find.assert_not_called()
+
+
+class TestIsValidWorktree:
+    def test_registered_worktree_checked_without_git(
+        self, tmp_path: Path, mock_subprocess_run: Callable[..., Mock]
+    ) -> None:
+        repo, worktree = tmp_path / "repo", tmp_path / "wt"
+        _init_repo(repo)
+        create_worktree(repo, worktree, "feature")
+        mock_run = mock_subprocess_run()
+        assert is_valid_worktree(repo, worktree) is True
+        mock_run.assert_not_called()
+
+    def test_pruned_worktree_is_invalid(self, tmp_path: Path) -> None:
+        repo, worktree = tmp_path / "repo", tmp_path / "wt"
+        _init_repo(repo)
+        create_worktree(repo, worktree, "feature")
+        shutil.rmtree(repo / ".git" / "worktrees")
+        assert is_valid_worktree(repo, worktree) is False
+
+
+class TestSyncUntrackedFiles:
+    def test_small_set_copied_without_rsync(self, tmp_path: Path) -> None:
+        repo, worktree = tmp_path / "repo", tmp_path / "wt"
+        _init_repo(repo)
+        (repo / ".gitignore").write_text(".env\n")
+        (repo / ".env").write_text("SECRET=1\n")
+        (repo / "conf").mkdir()
+        (repo / "conf" / "local.toml").write_text("x = 1\n")
+        (repo / "conf" / "cache.pyc").write_bytes(b"")
+        (repo / "env-link").symlink_to(".env")
+        worktree.mkdir()
+        with patch("src.commands.worktree._start_rsync") as mock_rsync:
+            sync_untracked_files(repo, worktree)
+        mock_rsync.assert_not_called()
+        assert (worktree / ".env").read_text() == "SECRET=1\n"
+        assert (worktree / "conf" / "local.toml").read_text() == "x = 1\n"
+        assert not (worktree / "conf" / "cache.pyc").exists()
+        assert (worktree / "env-link").readlink() == Path(".env")
+
+    def test_dirs_named_like_skipped_files_are_synced(self, tmp_path: Path) -> None:
+        repo, worktree = tmp_path / "repo", tmp_path / "wt"
+        _init_repo(repo)
+        (repo / "data.db").mkdir()
+        (repo / "data.db" / "notes.txt").write_text("keep\n")
+        (repo / "app.db").write_bytes(b"")
+        worktree.mkdir()
+        sync_untracked_files(repo, worktree)
+        assert (worktree / "data.db" / "notes.txt").read_text() == "keep\n"
+        assert not (worktree / "app.db").exists()
+
+    def test_nested_repo_created_as_empty_dir(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        repo, worktree = tmp_path / "repo", tmp_path / "wt"
+        _init_repo(repo)
+        subprocess.run(["git", "init", "-q", str(repo / "vendor" / "lib")], check=True)
+        (repo / "vendor" / "lib" / "lib.py").write_text("")
+        worktree.mkdir()
+        sync_untracked_files(repo, worktree)
+        assert (worktree / "vendor" / "lib").is_dir()
+        assert not (worktree / "vendor" / "lib" / "lib.py").exists()
+        assert "Could not copy" not in capsys.readouterr().out
+
+    def test_large_set_streamed_to_rsync(self, tmp_path: Path) -> None:
+        repo, worktree = tmp_path / "repo", tmp_path / "wt"
+        _init_repo(repo)
+        for i in range(40):
+            (repo / f"file{i}.txt").write_text("")
+        with patch("src.commands.worktree._start_rsync") as mock_rsync:
+            sync_untracked_files(repo, worktree)
+        written = b"".join(
+            call.args[0] for call in mock_rsync.return_value.stdin.write.mock_calls
+        )
+        assert sorted(written.split(b"\0")[:-1]) == sorted(
+            f"file{i}.txt".encode() for i in range(40)
+        )
+        assert not worktree.exists()
+
+    def test_reused_worktree_files_replaced_not_rewritten(self, tmp_path: Path) -> None:
+        repo, worktree = tmp_path / "repo", tmp_path / "wt"
+        _init_repo(repo)
+        (repo / "notes.txt").write_text("new\n")
+        worktree.mkdir()
+        (worktree / "notes.txt").write_text("old\n")
+        # A second name for the old file, as an open reader would still see it
+        (worktree / "reader").hardlink_to(worktree / "notes.txt")
+        sync_untracked_files(repo, worktree, inplace=False)
+        assert (worktree / "notes.txt").read_text() == "new\n"
+        assert (worktree / "reader").read_text() == "old\n"
+        assert not (worktree / "notes.txt.cw-partial").exists()
+
+    def test_rsync_inplace_only_when_requested(self, tmp_path: Path) -> None:
+        with patch("src.commands.worktree.subprocess.Popen") as mock_popen:
+            _start_rsync(tmp_path, tmp_path / "wt", inplace=True)
+            assert "--inplace" in mock_popen.call_args.args[0]
+            _start_rsync(tmp_path, tmp_path / "wt", inplace=False)
+            assert "--inplace" not in mock_popen.call_args.args[0]
+
+    def test_listing_failure_raises_with_git_error(self, tmp_path: Path) -> None:
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            sync_untracked_files(tmp_path, tmp_path / "wt")
+        assert "not a git repository" in excinfo.value.stderr
+
+    def test_rsync_exiting_early_does_not_raise(self, tmp_path: Path) -> None:
+        repo, worktree = tmp_path / "repo", tmp_path / "wt"
+        _init_repo(repo)
+        for i in range(40):
+            (repo / f"file{i}.txt").write_text("")
+
+        def start_exited_rsync(*_args: object) -> subprocess.Popen[bytes]:
+            rsync = subprocess.Popen(["true"], stdin=subprocess.PIPE)
+            rsync.wait()
+            return rsync
+
+        with patch("src.commands.worktree._start_rsync", start_exited_rsync):
+            sync_untracked_files(repo, worktree)
+
+
+class TestUncommittedChanges:
+    def test_keeps_leading_status_column(
+        self, mock_subprocess_run: Callable[..., Mock]
+    ) -> None:
+        mock_subprocess_run(" M src/app.py\n?? new.txt\n")
+        assert uncommitted_changes(Path("/wt")) == " M src/app.py\n?? new.txt"
+
+    def test_clean_worktree(self, mock_subprocess_run: Callable[..., Mock]) -> None:
+        mock_subprocess_run()
+        assert uncommitted_changes(Path("/wt")) == ""
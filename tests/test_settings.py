@@ -0,0 +1,59 @@
+"""Tests for src.settings."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import typer
+
+import src.settings
+from src.settings import ClaudwaySettings, save_setting
+
+
+@pytest.fixture(autouse=True)
+def config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.setattr(src.settings, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(src.settings, "CONFIG_FILE", tmp_path / "config.toml")
+    ClaudwaySettings.load.cache_clear()
+    yield tmp_path
+    ClaudwaySettings.load.cache_clear()
+
+
+class TestClaudwaySettingsLoad:
+    def test_defaults_without_config(self) -> None:
+        assert ClaudwaySettings.load().default_command == "claude"
+
+    def test_reads_config(self, config_dir: Path) -> None:
+        (config_dir / "config.toml").write_text('default_command = "nvim"\n')
+        assert ClaudwaySettings.load().default_command == "nvim"
+
+    def test_invalid_utf8_exits(self, config_dir: Path) -> None:
+        (config_dir / "config.toml").write_bytes(b'default_command = "\xff"\n')
+        with pytest.raises(typer.Exit):
+            ClaudwaySettings.load()
+
+    def test_ignores_unknown_keys(self, config_dir: Path) -> None:
+        (config_dir / "config.toml").write_text('default_command = "nvim"\nx = 1\n')
+        assert ClaudwaySettings.load().default_command == "nvim"
+
+    def test_wrong_type_exits(self, config_dir: Path) -> None:
+        (config_dir / "config.toml").write_text("default_command = 3\n")
+        with pytest.raises(typer.Exit):
+            ClaudwaySettings.load()
+
+    def test_cached_within_process(self) -> None:
+        assert ClaudwaySettings.load() is ClaudwaySettings.load()
+
+
+class TestSaveSetting:
+    def test_round_trip(self) -> None:
+        ClaudwaySettings.load()
+        save_setting("default_command", "hx")
+        assert ClaudwaySettings.load().default_command == "hx"
+
+    def test_preserves_other_keys(self, config_dir: Path) -> None:
+        (config_dir / "config.toml").write_text('other = "x"\n')
+        save_setting("default_command", "hx")
+        text = (config_dir / "config.toml").read_text()
+        assert 'other = "x"' in text
+        assert 'default_command = "hx"' in text